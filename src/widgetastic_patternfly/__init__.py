@@ -1,10 +1,13 @@
 """This package contains classes that represent widgets in Patternfly for Widgetastic"""
+import copy
 import functools
 import re
 import time
 from collections import namedtuple
+from contextlib import contextmanager
 from datetime import datetime
 from operator import not_
+from textwrap import dedent
 
 from cached_property import cached_property
 from wait_for import TimedOutError
@@ -29,6 +32,7 @@ from widgetastic.widget import Text
 from widgetastic.widget import TextInput
 from widgetastic.widget import View
 from widgetastic.widget import Widget
+from widgetastic.xpath import normalize_space
 from widgetastic.xpath import quote
 
 from .utils import PFIcon
@@ -39,6 +43,14 @@ try:
 except AttributeError:
     Pattern = re._pattern_type
 
+# Used by BootstrapTreeview.image_getter
+_STYLE_URL_RE = re.compile(r'url\("([^"]+)"\)')
+_IMAGE_NAME_RE = re.compile(r"/([^/]+)-[0-9a-f]+\.(?:png|svg)$")
+_IMAGE_CLASS_PREFIXES = ("fa-", "product-", "vendor-", "pficon-")
+
+# Default of StatusNotification.read(icon), None means no icon there
+_NOT_READ = object()
+
 
 def retry_element(method):
     """Decorator to invoke method one or more times, if StaleElementReferenceException or
@@ -60,6 +72,133 @@ def retry_element(method):
     return retry_element_wrapper
 
 
+def has_class(browser, locator, class_name, *args, **kwargs):
+    """Check whether the element has given class, without transferring all of its classes.
+
+    Args:
+        browser: browser instance to query the element
+        locator: locator of the element, further args and kwargs are passed to ``browser.element``
+        class_name: the class to look for
+    """
+    return browser.execute_script(
+        "return arguments[0].classList.contains(arguments[1]);",
+        browser.element(locator, *args, **kwargs),
+        class_name,
+        silent=True,
+    )
+
+
+_ELEMENT_TEXTS_SCRIPT = """\
+    var found = document.evaluate(
+        arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var result = [];
+    for (var i = 0; i < found.snapshotLength; i++) {
+        var el = found.snapshotItem(i);
+        result.push(el.innerText || el.textContent || "");
+    }
+    return result;
+"""
+
+
+def element_texts(browser, locator, parent):
+    """Read the texts of all the elements matching the locator in a single script call.
+
+    The texts are normalized the same way ``browser.text`` normalizes them.
+
+    Args:
+        browser: browser instance to run the script
+        locator: XPath locator of the elements, relative to the parent
+        parent: element or widget the locator is relative to
+    """
+    return [
+        normalize_space(text)
+        for text in browser.execute_script(_ELEMENT_TEXTS_SCRIPT, parent, locator, silent=True)
+    ]
+
+
+_PFICON_NAME_SCRIPT = """\
+    var el = document.evaluate(
+        arguments[1], arguments[0], null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    if (el === null) {
+        return null;
+    }
+    var icon = Array.from(el.classList).find(function (c) { return c.startsWith("pficon-"); });
+    return icon === undefined ? null : icon.substring(7);
+"""
+
+
+def pficon_name(browser, locator, parent):
+    """Name of the ``pficon-*`` icon of the element, looked up and read by a single script.
+
+    Args:
+        browser: browser instance to run the script
+        locator: XPath locator of the icon element, relative to the parent
+        parent: element or widget the locator is relative to
+
+    Returns:
+        the icon name without the ``pficon-`` prefix, None if there is no such element or icon
+    """
+    try:
+        return browser.execute_script(_PFICON_NAME_SCRIPT, parent, locator, silent=True)
+    except NoSuchElementException:
+        # the parent itself is not present
+        return None
+
+
+def execute_async_script(browser, script, *args, silent=False):
+    """Asynchronous counterpart of ``browser.execute_script``.
+
+    Widgets passed as arguments are turned into their elements at the time of the call and the
+    script is logged, the same way ``browser.execute_script`` does it.
+
+    Args:
+        browser: browser instance to run the script
+        script: the script, it calls back with its result through its last argument
+        *args: arguments of the script
+        silent: do not log the script
+    """
+    if not silent:
+        browser.logger.debug("execute_async_script: %r", script)
+    args = [arg.__element__() if isinstance(arg, Widget) else arg for arg in args]
+    return browser.selenium.execute_async_script(dedent(script), *args)
+
+
+class OperationCacheMixin:
+    """Mixin for widgets that want to remember browser queries for the duration of an operation.
+
+    Values are only remembered inside the :py:meth:`operation_cache` block, outside of it every
+    query goes to the browser as usual.
+    """
+
+    _operation_cache = None
+
+    @contextmanager
+    def operation_cache(self):
+        """Remember the values queried through :py:meth:`_cached` until the block is left."""
+        if self._operation_cache is not None:
+            # Nested operation, the outermost one owns the cache
+            yield
+            return
+        self._operation_cache = {}
+        try:
+            yield
+        finally:
+            self._operation_cache = None
+
+    def _cached(self, key, getter):
+        if self._operation_cache is None:
+            return getter()
+        if key not in self._operation_cache:
+            self._operation_cache[key] = getter()
+        return self._operation_cache[key]
+
+    def _forget(self, key):
+        """Drop the remembered value, so it is queried again, e.g. an element that went stale."""
+        if self._operation_cache is not None:
+            self._operation_cache.pop(key, None)
+
+
 class CandidateNotFound(Exception):
     """
     Raised if there is no candidate found whilst trying to traverse a tree.
@@ -265,13 +404,37 @@ class Input(TextInput):
             return None
 
 
-class NavDropdown(Widget, ClickableMixin):
+class NavDropdown(Widget, ClickableMixin, OperationCacheMixin):
     """The dropdowns used eg. in navigation. Usually located in the top navbar."""
 
     EXPAND_LOCATOR = (
         './a["aria-expanded" and ' '"aria-haspopup" and ' 'contains(@class, "dropdown-toggle")]'
     )
     TEXT_LOCATOR = "./a//p"
+    ITEM_LOCATOR = "./ul/li[normalize-space(.)={}]"
+    ITEMS_LOCATOR = './ul/li[not(contains(@class, "divider"))]'
+    # {expandable, items} for the expand and items locators given as arguments, items are
+    # [text, disabled]
+    SNAPSHOT_SCRIPT = """\
+        var root = arguments[0];
+        function evaluate(locator) {
+            var found = document.evaluate(
+                locator, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var result = [];
+            for (var i = 0; i < found.snapshotLength; i++) {
+                result.push(found.snapshotItem(i));
+            }
+            return result;
+        }
+        return {
+            expandable: evaluate(arguments[1]).length > 0,
+            items: evaluate(arguments[2]).map(function (item) {
+                return [
+                    item.innerText || item.textContent || "",
+                    item.classList.contains("disabled")];
+            })
+        };
+    """
 
     ROOT = ParametrizedLocator(
         "//nav"
@@ -287,20 +450,35 @@ class NavDropdown(Widget, ClickableMixin):
     def read(self):
         return self.text
 
+    def _snapshot(self):
+        """Whether the dropdown is expandable and its items, all read by a single script.
+
+        Returns:
+            :py:class:`dict` with ``expandable`` and ``items``, a list of ``(text, disabled)``
+        """
+
+        def read():
+            snapshot = self.browser.execute_script(
+                self.SNAPSHOT_SCRIPT, self, self.EXPAND_LOCATOR, self.ITEMS_LOCATOR, silent=True
+            )
+            return {
+                "expandable": snapshot["expandable"],
+                "items": [
+                    (normalize_space(text), disabled) for text, disabled in snapshot["items"]
+                ],
+            }
+
+        return self._cached("snapshot", read)
+
     @property
     def expandable(self):
-        try:
-            self.browser.element(self.EXPAND_LOCATOR)
-        except NoSuchElementException:
-            return False
-        else:
-            return True
+        return self._snapshot()["expandable"]
 
     @property
     def expanded(self):
         if not self.expandable:
             return False
-        return "open" in self.browser.classes(self)
+        return has_class(self.browser, self, "open")
 
     @property
     def collapsed(self):
@@ -336,41 +514,30 @@ class NavDropdown(Widget, ClickableMixin):
 
     @property
     def icon(self):
-        try:
-            el = self.browser.element('./a/span[contains(@class, "pficon")]', parent=self)
-            for class_ in self.browser.classes(el):
-                if class_.startswith("pficon-"):
-                    return class_[7:]
-            else:
-                return None
-        except NoSuchElementException:
-            return None
+        return pficon_name(self.browser, './a/span[contains(@class, "pficon")]', self)
 
     @property
     def items(self):
-        return [
-            self.browser.text(element)
-            for element in self.browser.elements(
-                './ul/li[not(contains(@class, "divider"))]', parent=self
-            )
-        ]
+        return [text for text, _ in self._snapshot()["items"]]
 
     def has_item(self, item):
         return item in self.items
 
     def item_enabled(self, item):
-        if not self.has_item(item):
-            raise ValueError(f"There is not such item {item}")
-        element = self.browser.element(f"./ul/li[normalize-space(.)={quote(item)}]", parent=self)
-        return "disabled" not in self.browser.classes(element)
+        for text, disabled in self._snapshot()["items"]:
+            if text == item:
+                return not disabled
+        raise ValueError(f"There is not such item {item}")
 
     def select_item(self, item):
-        if not self.item_enabled(item):
-            raise ValueError(f"Cannot click disabled item {item}")
+        # The items and expandability are read once for the whole selection
+        with self.operation_cache():
+            if not self.item_enabled(item):
+                raise ValueError(f"Cannot click disabled item {item}")
 
-        self.expand()
-        self.logger.info(f"selecting item {item}")
-        self.browser.click(f"./ul/li[normalize-space(.)={quote(item)}]", parent=self)
+            self.expand()
+            self.logger.info(f"selecting item {item}")
+            self.browser.click(self.ITEM_LOCATOR.format(quote(item)), parent=self)
 
     def __repr__(self):
         return f"{type(self).__name__}(id={self.id!r})"
@@ -828,7 +995,7 @@ class Accordion(View, ClickableMixin):
         return f"<Accordion {self.accordion_name!r}>"
 
 
-class BootstrapSelect(Widget, ClickableMixin):
+class BootstrapSelect(Widget, ClickableMixin, OperationCacheMixin):
     """This class represents the Bootstrap Select widget.
 
     Args:
@@ -846,6 +1013,27 @@ class BootstrapSelect(Widget, ClickableMixin):
     BY_PARTIAL_VISIBLE_TEXT = (
         '//div/ul/li/a[./span[contains(@class, "text") and contains(normalize-space(.), {})]]'
     )
+    # [text, data-original-index] pairs of all the options
+    ALL_OPTIONS_SCRIPT = """\
+        return Array.prototype.map.call(
+            arguments[0].querySelectorAll(":scope > div > ul > li"),
+            function (li) {
+                var span = li.querySelector('span[class*="text"]');
+                return [
+                    span === null ? "" : (span.innerText || span.textContent || ""),
+                    li.getAttribute("data-original-index")
+                ];
+            });
+    """
+    # Texts of the selected options
+    ALL_SELECTED_OPTIONS_SCRIPT = """\
+        return Array.prototype.map.call(
+            arguments[0].querySelectorAll(
+                ':scope > div > ul > li[class*="selected"] > a > span[class*="text"]'),
+            function (span) {
+                return span.innerText || span.textContent || "";
+            });
+    """
 
     def __init__(
         self, parent, id=None, name=None, locator=None, can_hide_on_select=False, logger=None
@@ -869,7 +1057,7 @@ class BootstrapSelect(Widget, ClickableMixin):
     @property
     def is_open(self):
         try:
-            return "open" in self.browser.classes(self)
+            return has_class(self.browser, self, "open")
         except StaleElementReferenceException:
             self.logger.warning(
                 "Got a StaleElementReferenceException in .is_open, but ignoring. Returned False."
@@ -878,7 +1066,7 @@ class BootstrapSelect(Widget, ClickableMixin):
 
     @property
     def is_multiple(self):
-        return "show-tick" in self.browser.classes(self)
+        return self._cached("is_multiple", lambda: has_class(self.browser, self, "show-tick"))
 
     def open(self):
         if not self.is_open:
@@ -904,6 +1092,10 @@ class BootstrapSelect(Widget, ClickableMixin):
                 pass more than one item, it will raise an exception. If you want to select using
                 partial match, use the :py:class:`BootstrapSelect.partial` to wrap the value.
         """
+        with self.operation_cache():
+            self._select_by_visible_text(*items)
+
+    def _select_by_visible_text(self, *items):
         if len(items) > 1 and not self.is_multiple:
             raise ValueError(
                 f"The BootstrapSelect {self.locator} does not allow multiple selections"
@@ -913,61 +1105,48 @@ class BootstrapSelect(Widget, ClickableMixin):
             if isinstance(item, partial_match):
                 item = item.item
                 self.logger.info("selecting by partial visible text: %r", item)
-                try:
-                    self.browser.click(
-                        self.BY_PARTIAL_VISIBLE_TEXT.format(quote(item)),
-                        parent=self,
-                        force_scroll=True,
-                    )
-                except NoSuchElementException:
-                    try:
-                        # Added this as for some views(some tags pages) dropdown is separated from
-                        # button and doesn't have exact id or name
-                        self.browser.click(
-                            self.BY_PARTIAL_VISIBLE_TEXT.format(quote(item)), force_scroll=True
-                        )
-                    except NoSuchElementException:
-                        raise SelectItemNotFound(
-                            widget=self, item=item, options=[opt.text for opt in self.all_options]
-                        )
+                self._click_option(item, self.BY_PARTIAL_VISIBLE_TEXT.format(quote(item)))
             else:
                 self.logger.info("selecting by visible text: %r", item)
-                try:
-                    self.browser.click(
-                        self.BY_VISIBLE_TEXT.format(quote(item)), parent=self, force_scroll=True
-                    )
-                except NoSuchElementException:
-                    try:
-                        # Added this as for some views(some tags pages) dropdown is separated from
-                        # button and doesn't have exact id or name
-                        self.browser.click(
-                            self.BY_VISIBLE_TEXT.format(quote(item)), force_scroll=True
-                        )
-                    except NoSuchElementException:
-                        raise SelectItemNotFound(
-                            widget=self, item=item, options=[opt.text for opt in self.all_options]
-                        )
+                self._click_option(item, self.BY_VISIBLE_TEXT.format(quote(item)))
         self.close()
 
+    def _click_option(self, item, locator):
+        if locator.startswith("/"):
+            # An absolute locator matches in the whole page regardless of the parent
+            parents = [None]
+        else:
+            # Added this as for some views(some tags pages) dropdown is separated from
+            # button and doesn't have exact id or name
+            parents = [self, None]
+        for parent in parents:
+            try:
+                return self.browser.click(locator, parent=parent, force_scroll=True)
+            except NoSuchElementException:
+                pass
+        raise SelectItemNotFound(
+            widget=self, item=item, options=[opt.text for opt in self.all_options]
+        )
+
     @property
     def all_selected_options(self):
         return [
-            self.browser.text(e)
-            for e in self.browser.elements(
-                './div/ul/li[contains(@class, "selected")]/a/span[contains(@class, "text")]',
-                parent=self,
+            normalize_space(text)
+            for text in self.browser.execute_script(
+                self.ALL_SELECTED_OPTIONS_SCRIPT, self, silent=True
             )
         ]
 
     @property
     def all_options(self):
-        b = self.browser
+        return self._cached("all_options", self._read_all_options)
+
+    def _read_all_options(self):
         return [
-            self.Option(
-                b.text(b.element('.//span[contains(@class, "text")]', parent=e)),
-                e.get_attribute("data-original-index"),
+            self.Option(normalize_space(text), value)
+            for text, value in self.browser.execute_script(
+                self.ALL_OPTIONS_SCRIPT, self, silent=True
             )
-            for e in b.elements("./div/ul/li", parent=self)
         ]
 
     @property
@@ -981,22 +1160,28 @@ class BootstrapSelect(Widget, ClickableMixin):
             return self.selected_option
 
     def fill(self, items):
-        if not isinstance(items, (list, tuple, set)):
-            items = {items}
-        elif not isinstance(items, set):
-            items = set(items)
+        # A plain string is a single item, never iterate it character by character
+        items = (
+            frozenset(items)
+            if isinstance(items, (list, tuple, set, frozenset))
+            else frozenset((items,))
+        )
 
-        if set(self.all_selected_options) == items:
-            return False
-        else:
-            self.select_by_visible_text(*items)
-            return True
+        # The selection is compared using a single snapshot, the select itself then shares the
+        # operation cache, so is_multiple and all_options are not queried again
+        with self.operation_cache():
+            selected = frozenset(self.all_selected_options)
+            if selected == items:
+                return False
+            else:
+                self._select_by_visible_text(*items)
+                return True
 
     def __repr__(self):
         return f"{type(self).__name__}(locator={self.locator!r})"
 
 
-class BootstrapTreeview(Widget):
+class BootstrapTreeview(Widget, OperationCacheMixin):
     """A class representing the Bootstrap treeview used in newer builds.
 
     Implements ``expand_path``, ``click_path``, ``read_contents``. All are implemented in manner
@@ -1031,6 +1216,138 @@ class BootstrapTreeview(Widget):
     IS_EXPANDED = './span[contains(@class, "expand-icon") and contains(@class, "fa-angle-down")]'
     IS_LOADING = './span[contains(@class, "expand-icon") and contains(@class, "fa-spinner")]'
     INDENT = './span[contains(@class, "indent")]'
+    # Texts of all the nodes on the path to the node with given nodeid, starting from the level
+    # given by the third argument. Nodes that cannot be found are reported as null.
+    PATH_TEXTS_SCRIPT = """\
+        var root = arguments[0], nodeid = arguments[1].split("."), result = [];
+        for (var end = arguments[2]; end <= nodeid.length; end++) {
+            var item = root.querySelector(
+                ':scope > ul > li[data-nodeid="' + nodeid.slice(0, end).join(".") + '"]');
+            result.push(item === null ? null : (item.innerText || item.textContent || ""));
+        }
+        return result;
+    """
+    # nodeid of the first child of the node with given nodeid (root items if null) whose
+    # normalized text equals the third argument, null if there is no such child. The text is read
+    # like browser.text does, the rendered innerText and the textContent only if that is empty.
+    CHILD_NODEID_WITH_TEXT_SCRIPT = """\
+        var root = arguments[0], parent = arguments[1], text = arguments[2];
+        var prefix = "", indent = 0;
+        if (parent !== null) {
+            var parentItem = root.querySelector(':scope > ul > li[data-nodeid="' + parent + '"]');
+            if (parentItem === null) {
+                return null;
+            }
+            prefix = parent + ".";
+            indent = parentItem.querySelectorAll(":scope > span.indent").length + 1;
+        }
+        var items = root.querySelectorAll(":scope > ul > li[data-nodeid]");
+        for (var i = 0; i < items.length; i++) {
+            var nodeid = items[i].getAttribute("data-nodeid");
+            if (nodeid.indexOf(prefix) !== 0
+                    || items[i].querySelectorAll(":scope > span.indent").length !== indent) {
+                continue;
+            }
+            var itemText = items[i].innerText || items[i].textContent || "";
+            if (itemText.replace(/\\s+/g, " ").trim() === text) {
+                return nodeid;
+            }
+        }
+        return null;
+    """
+    # Asynchronous, calls back with true as soon as the node with given nodeid is done loading and
+    # its expanded state matches the second argument, or with false after given amount of ms.
+    WAIT_FOR_NODE_STATE_SCRIPT = """\
+        var root = arguments[0], nodeid = arguments[1], expanded = arguments[2];
+        var callback = arguments[arguments.length - 1], done = false, timer = null;
+        var observer = new MutationObserver(check);
+        function finish(result) {
+            if (!done) {
+                done = true;
+                observer.disconnect();
+                clearTimeout(timer);
+                callback(result);
+            }
+        }
+        function check() {
+            // The tree is re-rendered on expansion, so the node has to be looked up every time
+            var icon = root.querySelector(
+                ':scope > ul > li[data-nodeid="' + nodeid + '"] > span.expand-icon');
+            if (icon !== null && !icon.classList.contains("fa-spinner")
+                    && icon.classList.contains("fa-angle-down") === expanded) {
+                finish(true);
+            }
+        }
+        observer.observe(
+            root, {attributes: true, attributeFilter: ["class"], childList: true, subtree: true});
+        timer = setTimeout(function () { finish(false); }, arguments[3]);
+        check();
+    """
+    # JS counterpart of image_getter, shared by the scripts below
+    NODE_IMAGE_FUNCTION = """\
+        function image(item) {
+            var node = item.querySelector(
+                ':scope > span[class*="node-image"], :scope > span[class*="node-icon"]');
+            if (node === null) {
+                return null;
+            }
+            if (node.style.cssText) {
+                var href = /url\\("([^"]+)"\\)/.exec(node.style.cssText);
+                var name = href && /\\/([^\\/]+)-[0-9a-f]+\\.(?:png|svg)$/.exec(href[1]);
+                return name ? name[1] : null;
+            }
+            for (var i = 0; i < node.classList.length; i++) {
+                if (/^(fa-|product-|vendor-|pficon-)/.test(node.classList[i])) {
+                    return node.classList[i];
+                }
+            }
+            return null;
+        }
+    """
+    # {nodeid: image} of all the nodes currently rendered in the tree
+    NODE_IMAGES_SCRIPT = dedent(NODE_IMAGE_FUNCTION) + dedent(
+        """\
+        var images = {}, items = arguments[0].querySelectorAll(":scope > ul > li[data-nodeid]");
+        for (var i = 0; i < items.length; i++) {
+            images[items[i].getAttribute("data-nodeid")] = image(items[i]);
+        }
+        return images;
+    """
+    )
+    # Nested {text, image, children} records of the node with given nodeid and all its
+    # descendants, or null if any node of the subtree is collapsed or still loading.
+    DUMP_SUBTREE_SCRIPT = dedent(NODE_IMAGE_FUNCTION) + dedent(
+        """\
+        var root = arguments[0], nodeid = arguments[1], records = {}, top = null;
+        var items = root.querySelectorAll(":scope > ul > li[data-nodeid]");
+        for (var i = 0; i < items.length; i++) {
+            var id = items[i].getAttribute("data-nodeid");
+            if (id !== nodeid && id.indexOf(nodeid + ".") !== 0) {
+                continue;
+            }
+            var icon = items[i].querySelector(":scope > span.expand-icon");
+            if (icon !== null && (icon.classList.contains("fa-spinner")
+                    || !icon.classList.contains("fa-angle-down"))) {
+                return null;
+            }
+            var record = {
+                text: items[i].innerText || items[i].textContent || "",
+                image: image(items[i]),
+                children: []
+            };
+            var parent = records[id.substring(0, id.lastIndexOf("."))];
+            records[id] = record;
+            if (id === nodeid) {
+                top = record;
+            } else if (parent !== undefined) {
+                parent.children.push(record);
+            } else {
+                return null;
+            }
+        }
+        return top;
+    """
+    )
 
     def __init__(self, parent, tree_id=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
@@ -1055,6 +1372,14 @@ class BootstrapTreeview(Widget):
                     "not implement .tree_id!"
                 )
 
+    def __element__(self):
+        """Within an operation, the root element is looked up only once.
+
+        The tree re-renders the list inside the root element when nodes are expanded, the root
+        element itself stays, so it can be reused for all the lookups of the operation.
+        """
+        return self._cached("root", super().__element__)
+
     def image_getter(self, item):
         """Look up the image that is hidden in the style tag or as a tag.
 
@@ -1071,17 +1396,15 @@ class BootstrapTreeview(Widget):
             return None
         style = self.browser.get_attribute("style", image_node)
         if style:
-            image_href = re.search(r'url\("([^"]+)"\)', style).groups()[0]
+            image_href = _STYLE_URL_RE.search(style).groups()[0]
             try:
-                return re.search(r"/([^/]+)-[0-9a-f]+\.(?:png|svg)$", image_href).groups()[0]
+                return _IMAGE_NAME_RE.search(image_href).groups()[0]
             except AttributeError:
                 return None
         else:
             classes = self.browser.classes(image_node)
             try:
-                return [
-                    c for c in classes if c.startswith(("fa-", "product-", "vendor-", "pficon-"))
-                ][0]
+                return [c for c in classes if c.startswith(_IMAGE_CLASS_PREFIXES)][0]
             except IndexError:
                 return None
 
@@ -1096,14 +1419,21 @@ class BootstrapTreeview(Widget):
 
     @property
     def currently_selected(self):
-        if self.selected_item is not None:
-            nodeid = self.get_nodeid(self.selected_item).split(".")
+        selected_item = self.selected_item
+        if selected_item is not None:
+            nodeid = self.get_nodeid(selected_item)
             root_id_len = len(self.get_nodeid(self.root_item).split("."))
+            # Resolve the whole path in the browser, one roundtrip regardless of the tree depth
+            texts = self.browser.execute_script(
+                self.PATH_TEXTS_SCRIPT, self, nodeid, root_id_len, silent=True
+            )
             result = []
-            for end in range(root_id_len, len(nodeid) + 1):
-                current_nodeid = ".".join(nodeid[:end])
-                text = self.browser.text(self.get_item_by_nodeid(current_nodeid))
-                result.append(text)
+            for end, text in enumerate(texts, root_id_len):
+                if text is None:
+                    # Raises CandidateNotFound unless the node appeared in the meantime
+                    current_nodeid = ".".join(nodeid.split(".")[:end])
+                    text = self.browser.text(self.get_item_by_nodeid(current_nodeid))
+                result.append(normalize_space(text))
             return result
         else:
             return None
@@ -1147,7 +1477,7 @@ class BootstrapTreeview(Widget):
         return not self.is_expanded(item)
 
     def is_selected(self, item):
-        return "node-selected" in self.browser.classes(item)
+        return has_class(self.browser, item, "node-selected")
 
     def get_nodeid(self, item):
         return self.browser.get_attribute("data-nodeid", item)
@@ -1227,17 +1557,36 @@ class BootstrapTreeview(Widget):
             self.logger.debug("Expanding collapsed node %s on tree %s", nodeid, self.tree_id)
             arrow = self.get_expand_arrow(node)
             self.browser.click(arrow)
-            time.sleep(0.1)
-            wait_for(
-                lambda: not self.is_loading(self.get_item_by_nodeid(nodeid)), delay=0.2, num_sec=30
-            )
-            wait_for(
-                lambda: self.is_expanded(self.get_item_by_nodeid(nodeid)), delay=0.2, num_sec=10
-            )
+            self._wait_for_node_state(nodeid, expanded=True, num_sec=30)
         else:
             self.logger.debug("Node %s already expanded on tree %s", nodeid, self.tree_id)
         return True
 
+    def _wait_for_node_state(self, nodeid, expanded, num_sec):
+        """Waits until the node is loaded and expanded or collapsed.
+
+        The waiting itself happens in the browser, which reports back as soon as the tree changes.
+        Every script call is kept well below the WebDriver script timeout. The delay only applies
+        after a failed try, so a stale root element does not make it a busy loop.
+        """
+        wait_for(lambda: self._node_state_reached(nodeid, expanded), delay=0.1, num_sec=num_sec)
+
+    def _node_state_reached(self, nodeid, expanded):
+        try:
+            return execute_async_script(
+                self.browser,
+                self.WAIT_FOR_NODE_STATE_SCRIPT,
+                self,
+                nodeid,
+                expanded,
+                5000,
+                silent=True,
+            )
+        except StaleElementReferenceException:
+            # The root element was replaced, it is looked up again on the next try
+            self._forget("root")
+            return False
+
     def collapse_node(self, nodeid):
         """Collapses a node given its nodeid. Must be visible
 
@@ -1255,10 +1604,7 @@ class BootstrapTreeview(Widget):
             self.logger.debug("Collapsing expanded node %s on tree %s", nodeid, self.tree_id)
             arrow = self.get_expand_arrow(node)
             self.browser.click(arrow)
-            time.sleep(0.1)
-            wait_for(
-                lambda: self.is_collapsed(self.get_item_by_nodeid(nodeid)), delay=0.2, num_sec=10
-            )
+            self._wait_for_node_state(nodeid, expanded=False, num_sec=10)
         else:
             self.logger.debug("Node %s already collapsed on tree %s", nodeid, self.tree_id)
         return True
@@ -1338,6 +1684,10 @@ class BootstrapTreeview(Widget):
         Raises:
             :py:class:`CandidateNotFound` when the node is not found in the tree.
         """
+        with self.operation_cache():
+            return self._expand_path(*path, **kwargs)
+
+    def _expand_path(self, *path, **kwargs):
         self.browser.plugin.ensure_page_safe()
         self.logger.info("Expanding path %s on tree %s", self.pretty_path(path), self.tree_id)
         node = self.root_item
@@ -1363,7 +1713,8 @@ class BootstrapTreeview(Widget):
             steps_tried.append(step)
             self.logger.debug("Expanding %r", steps_tried)
             image, step = self._process_step(step)
-            if node is not None and not self.expand_node(self.get_nodeid(node)):
+            nodeid = self.get_nodeid(node) if node is not None else None
+            if nodeid is not None and not self.expand_node(nodeid):
                 raise CandidateNotFound(
                     {
                         "message": "Could not find the item {} in Bootstrap tree {}".format(
@@ -1375,16 +1726,29 @@ class BootstrapTreeview(Widget):
                         ),
                     }
                 )
-            if isinstance(step, str):
-                # To speed up the search when having a string to match, pick up items with that text
-                child_items = self.child_items_with_text(node, step)
-            else:
-                # Otherwise we need to go through all of them.
-                child_items = self.child_items(node)
-            for child_item in child_items:
-                if self.validate_node(child_item, step, image):
-                    node = child_item
-                    break
+            candidate = None
+            if isinstance(step, str) and image is None:
+                # Plain text match can be done entirely in the browser, only the nodeid comes back
+                child_nodeid = self.browser.execute_script(
+                    self.CHILD_NODEID_WITH_TEXT_SCRIPT, self, nodeid, step, silent=True
+                )
+                if child_nodeid is not None:
+                    candidate = self.get_item_by_nodeid(child_nodeid)
+            if candidate is None:
+                # Also when the script found nothing, as browser.text, which is matched here, may
+                # not agree with the text the script reads in every case
+                if isinstance(step, str):
+                    # To speed up the search when having a string to match, pick up items with
+                    # that text
+                    child_items = self.child_items_with_text(node, step)
+                else:
+                    # Otherwise we need to go through all of them.
+                    child_items = self.child_items(node)
+                candidate = next(
+                    (item for item in child_items if self.validate_node(item, step, image)), None
+                )
+            if candidate is not None:
+                node = candidate
             else:
                 raise CandidateNotFound(
                     {
@@ -1424,7 +1788,9 @@ class BootstrapTreeview(Widget):
     def read_contents(self, nodeid=None, include_images=False, collapse_after_read=False):
         """Reads the contents of the tree into a tree structure of strings and lists.
 
-        This method is called recursively.
+        If the tree is already fully expanded and nothing is to be collapsed, the whole structure
+        is read by the browser in one go. Otherwise the tree is walked recursively, expanding the
+        nodes on the way.
 
         Args:
             nodeid: id of the node where the process should start from.
@@ -1436,23 +1802,56 @@ class BootstrapTreeview(Widget):
         Returns:
             :py:class:`list`
         """
-        if nodeid is None and self.root_item is not None:
-            return self.read_contents(
-                nodeid=self.get_nodeid(self.root_item),
-                include_images=include_images,
-                collapse_after_read=collapse_after_read,
+        with self.operation_cache():
+            if nodeid is None and self.root_item is not None:
+                nodeid = self.get_nodeid(self.root_item)
+
+            if not collapse_after_read:
+                dump = self.browser.execute_script(
+                    self.DUMP_SUBTREE_SCRIPT, self, nodeid, silent=True
+                )
+                if dump is not None:
+                    return self._contents_from_dump(dump, include_images)
+
+            return self._read_contents(
+                self.get_item_by_nodeid(nodeid), include_images, collapse_after_read, images={}
             )
 
-        item = self.get_item_by_nodeid(nodeid)
+    def _contents_from_dump(self, record, include_images):
+        text = normalize_space(record["text"])
+        this_item = (record["image"], text) if include_images else text
+        if record["children"]:
+            return [
+                this_item,
+                [self._contents_from_dump(child, include_images) for child in record["children"]],
+            ]
+        else:
+            return this_item
+
+    def _node_image(self, nodeid, images):
+        """Image of the node looked up in ``images``, which is refreshed with the images of all
+        the nodes rendered at the moment when the node is not there yet.
+        """
+        if nodeid not in images:
+            images.update(self.browser.execute_script(self.NODE_IMAGES_SCRIPT, self, silent=True))
+        return images.get(nodeid)
+
+    def _read_contents(self, item, include_images, collapse_after_read, images):
+        """Recursive part of :py:meth:`read_contents`, works with the node elements directly.
+
+        ``images`` is shared by the whole recursion, see :py:meth:`_node_image`.
+        """
+        nodeid = self.get_nodeid(item)
         self.expand_node(nodeid)
         result = []
 
         for child_item in self.child_items(item):
             result.append(
-                self.read_contents(
-                    nodeid=self.get_nodeid(child_item),
+                self._read_contents(
+                    child_item,
                     include_images=include_images,
                     collapse_after_read=collapse_after_read,
+                    images=images,
                 )
             )
 
@@ -1460,7 +1859,7 @@ class BootstrapTreeview(Widget):
             self.collapse_node(nodeid)
 
         if include_images:
-            this_item = (self.image_getter(item), self.browser.text(item))
+            this_item = (self._node_image(nodeid, images), self.browser.text(item))
         else:
             this_item = self.browser.text(item)
         if result:
@@ -1479,6 +1878,14 @@ class CheckableBootstrapTreeview(BootstrapTreeview):
 
     IS_CHECKABLE = './span[contains(@class, "check-icon")]'
     IS_CHECKED = './span[contains(@class, "check-icon") and contains(@class, "fa-check-square-o")]'
+    # [checkable, checked] of the node, same conditions as IS_CHECKABLE and IS_CHECKED
+    CHECK_STATE_SCRIPT = """\
+        var icons = arguments[0].querySelectorAll(':scope > span[class*="check-icon"]');
+        var checked = Array.prototype.some.call(icons, function (icon) {
+            return icon.getAttribute("class").indexOf("fa-check-square-o") !== -1;
+        });
+        return [icons.length > 0, checked];
+    """
 
     CheckNode = namedtuple("CheckNode", ["path"])
     UncheckNode = namedtuple("UncheckNode", ["path"])
@@ -1489,15 +1896,20 @@ class CheckableBootstrapTreeview(BootstrapTreeview):
     def is_checked(self, item):
         return bool(self.browser.elements(self.IS_CHECKED, parent=item))
 
+    def _check_state(self, item):
+        """Returns a tuple of :py:meth:`is_checkable` and :py:meth:`is_checked`, in one call."""
+        checkable, checked = self.browser.execute_script(self.CHECK_STATE_SCRIPT, item, silent=True)
+        return checkable, checked
+
     def check_uncheck_node(self, check, *path, **kwargs):
         leaf = self.expand_path(*path, **kwargs)
-        if not self.is_checkable(leaf):
+        checkable, checked = self._check_state(leaf)
+        if not checkable:
             raise TypeError(
                 "Item with path {} in {} is not checkable".format(
                     self.pretty_path(path), self.tree_id
                 )
             )
-        checked = self.is_checked(leaf)
         if checked != check:
             self.logger.info("%s %r", "Checking" if check else "Unchecking", path[-1])
             self.browser.click(self.IS_CHECKABLE, parent=leaf)
@@ -1516,9 +1928,8 @@ class CheckableBootstrapTreeview(BootstrapTreeview):
     def node_checked(self, *path, **kwargs):
         """Check if a checkbox is checked on the node in that path."""
         leaf = self.expand_path(*path, **kwargs)
-        if not self.is_checkable(leaf):
-            return False
-        return self.is_checked(leaf)
+        checkable, checked = self._check_state(leaf)
+        return checkable and checked
 
     def fill(self, node):
         """
@@ -1536,7 +1947,7 @@ class CheckableBootstrapTreeview(BootstrapTreeview):
         do_not_read_this_widget()
 
 
-class Dropdown(Widget):
+class Dropdown(Widget, OperationCacheMixin):
     """Represents the Patternfly/Bootstrap dropdown.
 
     Args:
@@ -1550,16 +1961,41 @@ class Dropdown(Widget):
     BUTTON_LOCATOR = "./button"
     ITEMS_LOCATOR = "./ul/li/a"
     ITEM_LOCATOR = "./ul/li/a[normalize-space(.)={}]"
+    # [text, disabled] of every item anchor matching the locator given as second argument
+    ITEM_STATES_SCRIPT = """\
+        var found = document.evaluate(
+            arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var result = [];
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var anchor = found.snapshotItem(i);
+            result.push([
+                anchor.innerText || anchor.textContent || "",
+                anchor.parentNode.classList.contains("disabled")]);
+        }
+        return result;
+    """
 
     def __init__(self, parent, text, logger=None):
         Widget.__init__(self, parent, logger=logger)
         self.text = text
 
+    def _item_states(self):
+        """``(text, disabled)`` of all the items of the dropdown, read by a single script."""
+
+        def read():
+            return [
+                (normalize_space(text), disabled)
+                for text, disabled in self.browser.execute_script(
+                    self.ITEM_STATES_SCRIPT, self, self.ITEMS_LOCATOR, silent=True
+                )
+            ]
+
+        return self._cached("item_states", read)
+
     @property
     def is_enabled(self):
         """Returns if the toolbar itself is enabled and therefore interactive."""
-        button = self.browser.element(self.BUTTON_LOCATOR, parent=self)
-        return "disabled" not in self.browser.classes(button)
+        return not has_class(self.browser, self.BUTTON_LOCATOR, "disabled", parent=self)
 
     def _verify_enabled(self):
         if not self.is_enabled:
@@ -1575,7 +2011,7 @@ class Dropdown(Widget):
 
     @property
     def is_open(self):
-        return "open" in self.browser.classes(self)
+        return has_class(self.browser, self, "open")
 
     def open(self):
         self._verify_enabled()
@@ -1601,9 +2037,7 @@ class Dropdown(Widget):
     @property
     def items(self):
         """Returns a list of all dropdown items as strings."""
-        return [
-            self.browser.text(el) for el in self.browser.elements(self.ITEMS_LOCATOR, parent=self)
-        ]
+        return [text for text, _ in self._item_states()]
 
     def has_item(self, item):
         """Returns whether the items exists.
@@ -1619,7 +2053,10 @@ class Dropdown(Widget):
     def item_element(self, item):
         """Returns a WebElement for given item name."""
         try:
-            return self.browser.element(self.ITEM_LOCATOR.format(quote(item)), parent=self)
+            return self._cached(
+                ("item_element", item),
+                lambda: self.browser.element(self.ITEM_LOCATOR.format(quote(item)), parent=self),
+            )
         except NoSuchElementException:
             try:
                 items = self.items
@@ -1646,6 +2083,10 @@ class Dropdown(Widget):
             Boolean - True if enabled, False if not.
         """
         self._verify_enabled()
+        for text, disabled in self._item_states():
+            if text == item:
+                return not disabled
+        # Not among the items read beforehand (eg. loaded on opening), look it up directly
         el = self.item_element(item)
         li = self.browser.element("..", parent=el)
         return "disabled" not in self.browser.classes(li)
@@ -1659,20 +2100,24 @@ class Dropdown(Widget):
         """
         self.logger.info("Selecting %r", item)
         try:
-            self.open()
-            if not self.item_enabled(item):
-                reason = self.item_title(item)
-                raise DropdownItemDisabled(
-                    'Item "{item}" of dropdown "{dropdown}" is disabled due to \n'
-                    "{reason}"
-                    "The following items are available: {available}".format(
-                        item=item, dropdown=self.text, reason=reason, available=";".join(self.items)
+            with self.operation_cache():
+                self.open()
+                if not self.item_enabled(item):
+                    reason = self.item_title(item)
+                    raise DropdownItemDisabled(
+                        'Item "{item}" of dropdown "{dropdown}" is disabled due to \n'
+                        "{reason}"
+                        "The following items are available: {available}".format(
+                            item=item,
+                            dropdown=self.text,
+                            reason=reason,
+                            available=";".join(self.items),
+                        )
                     )
-                )
-            self.browser.click(self.item_element(item), ignore_ajax=handle_alert is not None)
-            if handle_alert is not None:
-                self.browser.handle_alert(cancel=not handle_alert, wait=10.0)
-                self.browser.plugin.ensure_page_safe()
+                self.browser.click(self.item_element(item), ignore_ajax=handle_alert is not None)
+                if handle_alert is not None:
+                    self.browser.handle_alert(cancel=not handle_alert, wait=10.0)
+                    self.browser.plugin.ensure_page_safe()
         finally:
             try:
                 self.close(ignore_nonpresent=True)
@@ -1703,16 +2148,63 @@ class SelectorDropdown(Dropdown):
     ROOT = ParametrizedLocator(
         './/div[contains(@class, "dropdown") and ./button[@{@b_attr}={@b_attr_value|quote}]]'
     )
+    # Asynchronous, calls back with true as soon as the normalized text of the button equals the
+    # second argument, or with false after given amount of ms. The text is read like browser.text
+    # does, the rendered innerText and the textContent only if that is empty.
+    WAIT_FOR_SELECTED_SCRIPT = """\
+        var root = arguments[0], text = arguments[1];
+        var callback = arguments[arguments.length - 1], done = false, timer = null;
+        var observer = new MutationObserver(check);
+        function finish(result) {
+            if (!done) {
+                done = true;
+                observer.disconnect();
+                clearTimeout(timer);
+                callback(result);
+            }
+        }
+        function check() {
+            var button = root.querySelector(":scope > button");
+            var buttonText = button === null ? "" : (button.innerText || button.textContent || "");
+            if (buttonText.replace(/\\s+/g, " ").trim() === text) {
+                finish(true);
+            }
+        }
+        observer.observe(root, {characterData: true, childList: true, subtree: true});
+        timer = setTimeout(function () { finish(false); }, arguments[2]);
+        check();
+    """
 
     def __init__(self, parent, button_attr, button_attr_value, logger=None):
         # Skipping Dropdown init because it has nothing interesting for us
         Widget.__init__(self, parent, logger=logger)
         self.b_attr = button_attr
         self.b_attr_value = button_attr_value
+        # The attributes never change, so the locator is resolved only once
+        self.locator = self.ROOT
+
+    def __locator__(self):
+        return self.locator
 
     def item_select(self, item, *args, **kwargs):
         super().item_select(item, *args, **kwargs)
-        wait_for(lambda: self.currently_selected == item, num_sec=3, delay=0.2)
+        # The browser reports back as soon as the button changes, the delay only applies after a
+        # failed try
+        wait_for(lambda: self._item_selected(item), delay=0.1, num_sec=3)
+
+    def _item_selected(self, item):
+        try:
+            # The text read by the script may not agree with browser.text in every case, so
+            # currently_selected has the last word
+            return (
+                execute_async_script(
+                    self.browser, self.WAIT_FOR_SELECTED_SCRIPT, self, item, 1000, silent=True
+                )
+                or self.currently_selected == item
+            )
+        except StaleElementReferenceException:
+            # The dropdown was re-rendered, it is looked up again on the next try
+            return False
 
     def fill(self, value):
         if value == self.currently_selected:
@@ -1735,17 +2227,29 @@ class BootstrapSwitch(BaseInput):
     """
 
     PARENT = "./.."
-    ROOT = ParametrizedLocator(
-        "|".join(
-            [
-                ".//div/text()[normalize-space(.)={@label|quote}]/"
-                "preceding-sibling::div[1]//"
-                'div[contains(@class, "bootstrap-switch-container")]'
-                "{@input}",
-                './/div/div[contains(@class, "bootstrap-switch-container")]' "{@input}",
-            ]
-        )
+    # The angular classes take precedence over the checked state, see selected
+    SELECTED_SCRIPT = """\
+        var classes = arguments[0].classList;
+        if (classes.contains("ng-not-empty")) {
+            return true;
+        } else if (classes.contains("ng-empty")) {
+            return false;
+        } else {
+            return arguments[0].checked;
+        }
+    """
+    # Only one of these applies to a switch, depending on whether it is looked up by its label
+    LABEL_ROOT = ParametrizedLocator(
+        ".//div/text()[normalize-space(.)={@label|quote}]/"
+        "preceding-sibling::div[1]//"
+        'div[contains(@class, "bootstrap-switch-container")]'
+        "{@input}"
+    )
+    INPUT_ROOT = ParametrizedLocator(
+        './/div/div[contains(@class, "bootstrap-switch-container")]' "{@input}"
     )
+    # Either of the two, kept for the subclasses and the code that use it
+    ROOT = ParametrizedLocator("|".join([LABEL_ROOT.template, INPUT_ROOT.template]))
 
     def __init__(self, parent, id=None, name=None, label=None, logger=None):
         self._label = label
@@ -1763,19 +2267,17 @@ class BootstrapSwitch(BaseInput):
         else:
             raise ValueError("label, id and name cannot be used together")
 
-        BaseInput.__init__(self, parent, locator=self.ROOT, logger=logger)
+        root = self.LABEL_ROOT if self._label is not None else self.INPUT_ROOT
+        BaseInput.__init__(self, parent, locator=root, logger=logger)
+
+    def __locator__(self):
+        return self.locator
 
     @property
     def selected(self):
         # it seems there is a bug in patternfly lib because in some cases
         # BootstrapSwitch->input.checked returns False when control is definitely checked
-        classes = self.browser.classes(self)
-        if "ng-not-empty" in classes:
-            return True
-        elif "ng-empty" in classes:
-            return False
-        else:
-            return self.browser.is_selected(self)
+        return self.browser.execute_script(self.SELECTED_SCRIPT, self, silent=True)
 
     @property
     def is_displayed(self):
@@ -1823,6 +2325,19 @@ class AboutModal(Widget):
     ITEMS_LOC = './/div[@class="modal-body"]/div[@class="product-versions-pf"]/ul/li'
     # These are relative to the <li> elements under ITEMS_LOC above
     LABEL_LOC = "./strong"
+    # [label, text] pairs of the <li> elements matching the locator given as second argument
+    ITEMS_SCRIPT = """\
+        var found = document.evaluate(
+            arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var result = [];
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var item = found.snapshotItem(i), label = item.querySelector(":scope > strong");
+            result.push([
+                label === null ? "" : (label.innerText || label.textContent || ""),
+                item.innerText || item.textContent || ""]);
+        }
+        return result;
+    """
     # widgets for the title+trademark lines
     TITLE_LOC = './/div[@class="modal-body"]/*[self::h1 or self::h2]'
     TRADEMARK_LOC = './/div[@class="modal-body"]/div[@class="trademark-pf"]'
@@ -1830,18 +2345,19 @@ class AboutModal(Widget):
     def __init__(self, parent, id=None, logger=None):
         Widget.__init__(self, parent, logger=logger)
         self.id = id
-
-    def __locator__(self):
-        """If id was passed, parametrize it into a locator, otherwise use ROOT_LOC"""
+        # If id was passed, parametrize it into a locator, otherwise use ROOT_LOC
         if self.id is not None:
-            return (
+            self._locator = (
                 '//div[normalize-space(@id)="{}" and '
                 'contains(@class, "modal") and '
                 'contains(@class, "fade") and '
                 './/div[contains(@class, "about-modal-pf")]]'.format(self.id)
             )
         else:
-            return self.ROOT_LOC
+            self._locator = self.ROOT_LOC
+
+    def __locator__(self):
+        return self._locator
 
     @property
     def is_open(self):
@@ -1869,12 +2385,13 @@ class AboutModal(Widget):
         :return: dictionary of keys matching the bold field labels and their values
         """
         items = {}
-        list_elements = self.browser.elements(self.ITEMS_LOC, parent=self)
-        for element in list_elements:
-            # each list item has a label in a <strong> and the value following
-            # can't select this text after the strong via xpath and get an element
-            key = self.browser.text(self.LABEL_LOC, parent=element)
-            element_text = self.browser.text(element)
+        # each list item has a label in a <strong> and the value following, all of them are read
+        # by a single script
+        for key, element_text in self.browser.execute_script(
+            self.ITEMS_SCRIPT, self, self.ITEMS_LOC, silent=True
+        ):
+            key = normalize_space(key)
+            element_text = normalize_space(element_text)
 
             # value will include the label from the <strong> block, parse it out
             items.update({key: element_text.replace(key, "", 1).lstrip()})
@@ -1892,14 +2409,18 @@ class Modal(View):
     def __init__(self, parent, id=None, logger=None):
         self.id = id
         if id:
+            # The __locator__ generated for the class ROOT would ignore this one
             self.ROOT = ParametrizedLocator(
                 ".//div[normalize-space(@id)={@id|quote} and "
                 'contains(@class, "modal") and contains(@class, "fade") '
                 'and @role="dialog"]'
-            )
+            ).resolve(self)
 
         View.__init__(self, parent, logger=logger)
 
+    def __locator__(self):
+        return self.ROOT
+
     @property
     def title(self):
         return self.header.title.read()
@@ -1965,6 +2486,17 @@ class BreadCrumb(Widget):
     ROOT = '//ol[contains(@class, "breadcrumb")]'
     ELEMENTS = ".//li"
     LINK = ".//a"
+    # [element, text, classes] of every element matching the locator given as second argument
+    SNAPSHOT_SCRIPT = """\
+        var found = document.evaluate(
+            arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var result = [];
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var el = found.snapshotItem(i);
+            result.push([el, el.innerText || el.textContent || "", Array.from(el.classList)]);
+        }
+        return result;
+    """
 
     def __init__(self, parent, locator=None, logger=None):
         Widget.__init__(self, parent=parent, logger=logger)
@@ -1977,19 +2509,27 @@ class BreadCrumb(Widget):
     def _path_elements(self):
         return self.browser.elements(self.ELEMENTS, parent=self)
 
+    def _snapshot(self):
+        """Elements of the path with their texts and classes, all read by a single script."""
+        return [
+            (element, normalize_space(text), set(classes))
+            for element, text, classes in self.browser.execute_script(
+                self.SNAPSHOT_SCRIPT, self, self.ELEMENTS, silent=True
+            )
+        ]
+
     @property
     def locations(self):
-        return [self.browser.text(loc) for loc in self._path_elements]
+        return element_texts(self.browser, self.ELEMENTS, self)
 
     @property
     def active_location(self):
-        br = self.browser
-        return next(br.text(loc) for loc in self._path_elements if "active" in br.classes(loc))
+        return next(text for _, text, classes in self._snapshot() if "active" in classes)
 
     def click_location(self, name, handle_alert=True):
         br = self.browser
         try:
-            location = next(loc for loc in self._path_elements if br.text(loc) == name)
+            location = next(loc for loc, text, _ in self._snapshot() if text == name)
         except StopIteration:
             self.logger.exception(f"Given location name [{name}] not found")
             raise WidgetOperationFailed("Unable to click breadcrumb location, location not found")
@@ -2048,19 +2588,44 @@ class DatePicker(View):
         prev_button = Text(".//*[contains(@class, 'prev')]")
         next_button = Text(".//*[contains(@class, 'next')]")
         datepicker_switch = Text(".//*[contains(@class, 'datepicker-switch')]")
-        _elements = {}
+        # [element, text, classes] of every element matching the locator given as second argument
+        SNAPSHOT_SCRIPT = """\
+            var found = document.evaluate(
+                arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var result = [];
+            for (var i = 0; i < found.snapshotLength; i++) {
+                var el = found.snapshotItem(i);
+                result.push([el, el.innerText || el.textContent || "", Array.from(el.classList)]);
+            }
+            return result;
+        """
+        # (value, element, classes) of the selectable cells, implemented by the pickers
+        _entries = ()
+
+        def _snapshot(self, locator):
+            """Elements with their texts and classes, all read by a single script."""
+            return [
+                (el, normalize_space(text), set(classes))
+                for el, text, classes in self.browser.execute_script(
+                    self.SNAPSHOT_SCRIPT, self, locator, silent=True
+                )
+            ]
+
+        @property
+        def _elements(self):
+            return {value: el for value, el, _ in self._entries}
 
         def select(self, value):
-            for el, web_el in self._elements.items():
-                if el == value:
-                    web_el.click()
-                    return True
+            web_el = self._elements.get(value)
+            if web_el is not None:
+                web_el.click()
+                return True
 
         @property
         def active(self):
-            for el, web_el in self._elements.items():
-                if bool(self.browser.classes(web_el) & {"active", "focused"}):
-                    return el
+            for value, _, classes in self._entries:
+                if bool(classes & {"active", "focused"}):
+                    return value
 
     @View.nested
     class date_pick(HeaderView):  # noqa
@@ -2068,12 +2633,12 @@ class DatePicker(View):
         DATES = ".//table/tbody/tr/td"
 
         @property
-        def _elements(self):
-            dates = {}
-            for el in self.browser.elements(self.DATES):
-                if not bool({"old", "new", "disabled"} & self.browser.classes(el)):
-                    dates.update({int(el.text): el})
-            return dates
+        def _entries(self):
+            return [
+                (int(text), el, classes)
+                for el, text, classes in self._snapshot(self.DATES)
+                if not bool({"old", "new", "disabled"} & classes)
+            ]
 
     @View.nested
     class month_pick(HeaderView):  # noqa
@@ -2081,12 +2646,12 @@ class DatePicker(View):
         MONTHS = ".//table/tbody/tr/td/*"
 
         @property
-        def _elements(self):
-            months = {}
-            for el in self.browser.elements(self.MONTHS):
-                if not bool({"disabled"} & self.browser.classes(el)):
-                    months.update({el.text: el})
-            return months
+        def _entries(self):
+            return [
+                (text, el, classes)
+                for el, text, classes in self._snapshot(self.MONTHS)
+                if not bool({"disabled"} & classes)
+            ]
 
     @View.nested
     class year_pick(HeaderView):  # noqa
@@ -2094,18 +2659,15 @@ class DatePicker(View):
         YEARS = ".//table/tbody/tr/td/*"
 
         @property
-        def _elements(self):
-            years = {}
-            for el in self.browser.elements(self.YEARS):
-                if not bool({"old", "new", "disabled"} & self.browser.classes(el)):
-                    years.update({int(el.text): el})
-            return years
+        def _entries(self):
+            return [
+                (int(text), el, classes)
+                for el, text, classes in self._snapshot(self.YEARS)
+                if not bool({"old", "new", "disabled"} & classes)
+            ]
 
         def _pick(self, value):
-            for el, web_el in self._elements.items():
-                if el == value:
-                    web_el.click()
-                    return True
+            return super().select(value)
 
         def select(self, value):
             start_yr, end_yr = (int(item) for item in self.datepicker_switch.read().split("-"))
@@ -2227,13 +2789,20 @@ class StatusNotification(Widget):
         except NoSuchElementException:
             return None
 
-    def read(self):
+    def read(self, icon=_NOT_READ):
         """Read the notification attributes and return a dict
 
+        Args:
+            icon: PFIcon constant of the notification, or None for no icon, if it is already
+                known, e.g. read together with the other notifications of the card. Looked up when
+                not passed.
+
         Returns:
             dict containing icon and text attributes
         """
-        return {"icon": self.icon, "text": self.text}
+        if icon is _NOT_READ:
+            icon = self.icon
+        return {"icon": icon, "text": self.text}
 
     def click(self):
         """Click the anchor for this notification
@@ -2300,6 +2869,16 @@ class AggregateStatusCard(View):
         """tool for local methods to get the body element"""
         return self.browser.element(self.BODY, parent=self)
 
+    @property
+    def _title_count(self):
+        """COUNT relative to the card, so the title element does not have to be looked up first"""
+        return self.TITLE + self.COUNT[1:]
+
+    @property
+    def _body_notification(self):
+        """NOTIFICATION relative to the card, so the body element does not have to be looked up"""
+        return self.BODY + self.NOTIFICATION[1:]
+
     @property
     def count(self):
         """count in the title
@@ -2309,7 +2888,7 @@ class AggregateStatusCard(View):
             int count from the element
         """
         try:
-            return int(self.browser.text(self.browser.element(self.COUNT, parent=self._title)))
+            return int(self.browser.text(self._title_count, parent=self))
         except NoSuchElementException:
             return None
 
@@ -2334,7 +2913,7 @@ class AggregateStatusCard(View):
             list of notification elements, empty when there are none
         """
         try:
-            notes = self.browser.elements(self.NOTIFICATION, parent=self._body)
+            notes = self.browser.elements(self._body_notification, parent=self)
         except NoSuchElementException:
             return []
         return [
@@ -2343,7 +2922,10 @@ class AggregateStatusCard(View):
 
     def read(self):
         items = dict(icon=self.icon, count=self.count, name=self.name)
-        items.update({"notifications": [note.read() for note in self.notifications]})
+        notes = self.notifications
+        # the icons of all the notifications are read at once
+        icons = PFIcon.icons_from_elements([note.note_element for note in notes], self.browser)
+        items.update({"notifications": [note.read(icon=icon) for note, icon in zip(notes, icons)]})
         return items
 
     def click(self):
@@ -2389,6 +2971,22 @@ class Kebab(Widget):
     BUTTON = "./button"
     ITEM = "./ul/li/a[normalize-space(.)={}]"
     ITEMS = "./ul/li/a"
+    # Clicks the first item (matching the second argument) with given text, false if not found.
+    # The text is read like browser.text does, the rendered innerText and the textContent only if
+    # that is empty.
+    CLICK_ITEM_SCRIPT = """\
+        var found = document.evaluate(
+            arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var item = found.snapshotItem(i);
+            var text = item.innerText || item.textContent || "";
+            if (text.replace(/\\s+/g, " ").trim() === arguments[2]) {
+                item.click();
+                return true;
+            }
+        }
+        return false;
+    """
 
     def __init__(self, parent, id=None, locator=None, logger=None):
         Widget.__init__(self, parent=parent, logger=logger)
@@ -2400,6 +2998,9 @@ class Kebab(Widget):
         else:
             raise TypeError("You need to specify either id or locator")
 
+    def __locator__(self):
+        return self.locator
+
     @property
     def is_opened(self):
         """Returns opened state of the kebab."""
@@ -2412,7 +3013,7 @@ class Kebab(Widget):
         Returns:
             :py:class:`list` of :py:class:`str`
         """
-        return [self.browser.text(item) for item in self.browser.elements(self.ITEMS)]
+        return element_texts(self.browser, self.ITEMS, self)
 
     def has_item(self, item):
         """Returns whether the items exists.
@@ -2451,6 +3052,30 @@ class Kebab(Widget):
             if close:
                 self.close()
 
+    def js_select(self, item):
+        """Select a specific item from the kebab by clicking it in JavaScript.
+
+        The kebab is neither opened nor closed, so it takes a single call, but unlike
+        :py:meth:`item_select` it does not click like a user does. Only use it for items whose
+        click handler does not depend on the menu being open.
+
+        Args:
+            item: Item to be selected.
+
+        Raises:
+            :py:class:`DropdownItemNotFound` when there is no such item.
+        """
+        self.logger.info("Selecting %r by JavaScript", item)
+        if self.browser.execute_script(self.CLICK_ITEM_SCRIPT, self, self.ITEMS, item, silent=True):
+            return
+        # The text read by the script may not agree with the ITEM locator in every case, so the
+        # item is also looked up by that locator, as item_select does
+        try:
+            el = self.browser.element(self.ITEM.format(quote(item)), parent=self)
+        except NoSuchElementException:
+            raise DropdownItemNotFound(f"Item {item!r} not found in {self!r}")
+        self.browser.execute_script("arguments[0].click();", el, silent=True)
+
 
 class SparkLineChart(Widget, ClickableMixin):
     """Represents the Spark Line Chart from Patternfly (Data Visualization).
@@ -2468,10 +3093,31 @@ class SparkLineChart(Widget, ClickableMixin):
     # axis event mapping
     RECTS = ".//*[contains(@class, 'c3-event-rects c3-event-rects-single')]//*"
     tooltip = Text(".//div[contains(@class,'c3-tooltip-container')]")
+    # cheap fingerprint of the drawn data: axis ticks, the values d3 bound to each data series,
+    # event rects and legend states
+    FINGERPRINT_SCRIPT = """\
+        var root = arguments[0];
+        function all(selector, map) {
+            return Array.from(root.querySelectorAll(selector)).map(map).join("|");
+        }
+        return [
+            all(".c3-axis-x .tick", function (x) { return x.textContent; }),
+            all(".c3-target", function (x) {
+                var target = x.__data__ || {values: []};
+                return JSON.stringify([target.id, target.values.map(function (v) {
+                    return [v.x, v.value];
+                })]);
+            }),
+            all(".c3-event-rect", function (x) { return ""; }),
+            all(".c3-legend-item", function (x) {
+                return x.textContent + x.classList.contains("c3-legend-item-hidden");
+            })].join("#");
+    """
 
     def __init__(self, parent, id=None, locator=None, logger=None):
         """Create the widget"""
         Widget.__init__(self, parent, logger=logger)
+        self._last_read = None
         if id:
             self.locator = self.BASE_LOCATOR.format(quote(id))
         elif locator:
@@ -2479,12 +3125,37 @@ class SparkLineChart(Widget, ClickableMixin):
         else:
             raise TypeError("You need to specify either id or locator")
 
-    def read(self):
+    def __locator__(self):
+        return self.locator
+
+    def _fingerprint(self):
+        return self.browser.execute_script(self.FINGERPRINT_SCRIPT, self, silent=True)
+
+    def invalidate_cache(self):
+        """Forget the last read data, use when the chart was changed by other means"""
+        self._last_read = None
+
+    def read(self, force=False):
         """read all data on chart
 
+        The data of the last read is returned again while the chart fingerprint stays the same.
+
+        Args:
+            force: read the chart even if it did not change since the last read
+
         Returns:
-            :py:class:`list` complete data on chart
+            complete data on chart, its type depends on the chart
         """
+        if not force and self._last_read is not None:
+            fingerprint, data = self._last_read
+            if fingerprint == self._fingerprint():
+                return copy.deepcopy(data)
+        data = self._read()
+        # Taken after the read as that may have changed the chart (eg. displayed the legends)
+        self._last_read = (self._fingerprint(), data)
+        return copy.deepcopy(data)
+
+    def _read(self):
         data = []
         for el in self.browser.elements(self.RECTS):
             self.browser.move_to_element(el)
@@ -2505,23 +3176,68 @@ class SingleLineChart(SparkLineChart):
 
     X_AXIS = ".//*[contains(@class, 'c3-axis c3-axis-x')]/*[contains(@class, 'tick')]"
     tooltip = Table(locator=".//div[contains(@class,'c3-tooltip-container')]/table")
+    # [x-axis tick texts, event rect elements], for the locators given as arguments
+    AXIS_SCRIPT = """\
+        var root = arguments[0];
+        function evaluate(locator) {
+            var found = document.evaluate(
+                locator, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var result = [];
+            for (var i = 0; i < found.snapshotLength; i++) {
+                result.push(found.snapshotItem(i));
+            }
+            return result;
+        }
+        return [
+            evaluate(arguments[1]).map(function (x) { return x.textContent; }),
+            evaluate(arguments[2])];
+    """
+    # {headers, rows} texts of the tooltip table, for the header and row locators given as arguments
+    TOOLTIP_SCRIPT = """\
+        var table = arguments[0];
+        function text(el) {
+            return el.innerText || el.textContent || "";
+        }
+        function evaluate(locator) {
+            var found = document.evaluate(
+                locator, table, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var result = [];
+            for (var i = 0; i < found.snapshotLength; i++) {
+                result.push(found.snapshotItem(i));
+            }
+            return result;
+        }
+        return {
+            headers: evaluate(arguments[1]).map(text),
+            rows: evaluate(arguments[2]).map(function (row) {
+                return Array.from(row.querySelectorAll(":scope > td")).map(text);
+            })
+        };
+    """
 
     @property
     def _elements(self):
-        br = self.browser
-        return {
-            x.get_attribute("textContent"): el
-            for (x, el) in zip(br.elements(self.X_AXIS), br.elements(self.RECTS))
-        }
+        x_texts, rects = self.browser.execute_script(
+            self.AXIS_SCRIPT, self, self.X_AXIS, self.RECTS, silent=True
+        )
+        return dict(zip(x_texts, rects))
 
     def _get_data(self, elements):
         data = {}
         for el in elements:
-            self.tooltip.clear_cache()
             self.browser.move_to_element(el)
-            raw_data = {row[0].text: row[1].text for row in self.tooltip.rows()}
-            if self.tooltip.headers:
-                tooltip_data = {self.tooltip.headers[0]: raw_data}
+            # The whole tooltip is read by a single script instead of cell by cell
+            tooltip = self.browser.execute_script(
+                self.TOOLTIP_SCRIPT,
+                self.tooltip,
+                self.tooltip.HEADERS,
+                self.tooltip.ROWS,
+                silent=True,
+            )
+            raw_data = {normalize_space(row[0]): normalize_space(row[1]) for row in tooltip["rows"]}
+            headers = [normalize_space(header) or None for header in tooltip["headers"]]
+            if headers:
+                tooltip_data = {headers[0]: raw_data}
             else:
                 # In the absence of a header, `:` separates x-axis points and values.
                 tooltip_data = {
@@ -2530,12 +3246,7 @@ class SingleLineChart(SparkLineChart):
             data.update(tooltip_data)
         return data
 
-    def read(self):
-        """read all data on chart
-
-        Returns:
-            :py:class:`dict` complete data on chart
-        """
+    def _read(self):
         return self._get_data(self._elements.values())
 
     def get_values(self, x_axis):
@@ -2563,10 +3274,34 @@ class LineChart(SingleLineChart):
     """
 
     LEGENDS = ".//*[contains(@class, 'c3-legend-item c3-legend-item-')]"
+    # [text, element, displayed] of every legend matching the locator given as second argument
+    LEGEND_STATES_SCRIPT = """\
+        var found = document.evaluate(
+            arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var result = [];
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var leg = found.snapshotItem(i);
+            result.push([
+                leg.innerText || leg.textContent || "",
+                leg,
+                !leg.classList.contains("c3-legend-item-hidden")]);
+        }
+        return result;
+    """
+
+    @property
+    def _legend_states(self):
+        """``{legend: (element, displayed)}`` of all the legends, read by a single script."""
+        return {
+            normalize_space(text): (leg, displayed)
+            for text, leg, displayed in self.browser.execute_script(
+                self.LEGEND_STATES_SCRIPT, self, self.LEGENDS, silent=True
+            )
+        }
 
     @property
     def _legends(self):
-        return {self.browser.text(leg): leg for leg in self.browser.elements(self.LEGENDS)}
+        return {text: leg for text, (leg, _) in self._legend_states.items()}
 
     @property
     def legends(self):
@@ -2586,24 +3321,31 @@ class LineChart(SingleLineChart):
             :py:class:`bool` all available legends
         """
         if isinstance(leg, str):
-            leg = self._legends.get(leg, None)
+            # the state comes along with the legend element, no need to ask for the classes
+            return self._legend_states.get(leg, (None, False))[1]
 
         if leg:
             return "c3-legend-item-hidden" not in self.browser.classes(leg)
         else:
             return False
 
+    def _toggle_legends(self, displayed_legends):
+        """Click only the legends whose displayed state differs from the wanted one
+
+        Args:
+            displayed_legends: callable telling whether the legend of given name should be shown
+        """
+        for name, (legend, displayed) in self._legend_states.items():
+            if displayed != displayed_legends(name):
+                self.browser.click(legend)
+
     def hide_all_legends(self):
         """To hide all legends on chart"""
-        for legend in self._legends.values():
-            if self.legend_is_displayed(legend):
-                self.browser.click(legend)
+        self._toggle_legends(lambda name: False)
 
     def display_all_legends(self):
         """To display all legends on chart"""
-        for legend in self._legends.values():
-            if not self.legend_is_displayed(legend):
-                self.browser.click(legend)
+        self._toggle_legends(lambda name: True)
 
     def display_legends(self, *legends):
         """Display one or more legends on chart
@@ -2611,9 +3353,10 @@ class LineChart(SingleLineChart):
         Args:
             legends: One or Multiple legends name
         """
+        states = self._legend_states
         for legend in legends:
-            leg = self._legends.get(legend)
-            if not self.legend_is_displayed(leg):
+            leg, displayed = states.get(legend, (None, False))
+            if not displayed:
                 self.browser.click(leg)
 
     def hide_legends(self, *legends):
@@ -2622,9 +3365,10 @@ class LineChart(SingleLineChart):
         Args:
             legends: One or Multiple legends name
         """
+        states = self._legend_states
         for legend in legends:
-            leg = self._legends.get(legend)
-            if self.legend_is_displayed(leg):
+            leg, displayed = states.get(legend, (None, False))
+            if displayed:
                 self.browser.click(leg)
 
     def get_data_for_legends(self, *legends):
@@ -2636,16 +3380,11 @@ class LineChart(SingleLineChart):
         Returns:
             :py:class:`dict` data for selected legends
         """
-        self.hide_all_legends()
-        self.display_legends(*legends)
+        # hiding all and displaying the requested ones in one pass over a single states read
+        self._toggle_legends(lambda name: name in legends)
         return self._get_data(self._elements.values())
 
-    def read(self):
-        """read all data on chart
-
-        Returns:
-            :py:class:`dict` complete data on chart
-        """
+    def _read(self):
         self.display_all_legends()
         return self._get_data(self._elements.values())
 
@@ -2747,8 +3486,9 @@ class ItemsList(View):
         # You can also filter items in two main ways
         # 1) by an assoc_column that corresponds to an attribute of the item_class e.g.
         item_list = view.item_list
-        item_list.assoc_column = 'description' # if assoc_column was not defined in item_list def
         filtered_items = item_list[<desired_description>] # where <desired_description> is a str
+        # if assoc_column was not defined in item_list def, it can be passed to the items() method
+        filtered_items = item_list.items(<desired_description>, assoc_column='description')
         # 2) by key-value pairs
         item_filter = {'description': <desired_description>}
         filtered_items = view.item_list[item_filter]
@@ -2762,6 +3502,21 @@ class ItemsList(View):
 
     ROOT = './/div[contains(@class,"list-view-pf-view")]'
     ITEMS = './/div[contains(@class,"list-group-item-header")]'
+    # Texts of the descriptions (third argument) of the items (locators in the second argument),
+    # null for the items or descriptions that cannot be found
+    DESCRIPTIONS_SCRIPT = """\
+        var root = arguments[0], result = [];
+        function first(locator, context) {
+            return document.evaluate(
+                locator, context, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        for (var i = 0; i < arguments[1].length; i++) {
+            var item = first(arguments[1][i], root);
+            var desc = item === null ? null : first(arguments[2], item);
+            result.push(desc === null ? null : (desc.innerText || desc.textContent || ""));
+        }
+        return result;
+    """
     item_class = ListItem  # default item_class
 
     def __init__(self, parent, assoc_column=None, logger=None):
@@ -2794,13 +3549,19 @@ class ItemsList(View):
         return len(self.browser.elements(self.ITEMS, parent=self))
 
     # methods
-    def items(self, item_filter=None):
-        """returns a generator for all Items matching the item_filter"""
+    def items(self, item_filter=None, assoc_column=None):
+        """returns a generator for all Items matching the item_filter
+
+        Args:
+            item_filter: string, dict, int, or None
+            assoc_column: attribute the string filter is matched against, defaults to
+                :py:attr:`assoc_column`
+        """
         start = 1  # start at 1 and not 0 since position() returns 1 as the first index
         stop = self.item_count + 1
         # filter via key, value pair
         if isinstance(item_filter, dict):
-            key, value = next(item_filter.items())
+            key, value = next(iter(item_filter.items()))
             if len(item_filter) > 1:
                 self.logger.warning(
                     "List-view filter currently not implemented for dictionaries"
@@ -2808,7 +3569,7 @@ class ItemsList(View):
                 )
         # filter via string, note the default
         elif isinstance(item_filter, str):
-            key = self.assoc_column
+            key = assoc_column or self.assoc_column
             value = item_filter
         # filter via index (note that this is used via 0-based indexing
         # for use with the xpath of Item a 1 must be added to the index)
@@ -2824,10 +3585,42 @@ class ItemsList(View):
         else:
             raise TypeError("item_filter must be of type: string, dict, int, or None!")
 
-        for i in range(start, stop):
-            item = self.item_class(self, index=i)
-            if getattr(item, key, None) == value:
-                yield item
+        items = [self.item_class(self, index=i) for i in range(start, stop)]
+        descriptions = self._descriptions(items) if key == "description" else None
+        if descriptions is not None:
+            # all the descriptions were read at once, only the matching items are yielded
+            for item, description in zip(items, descriptions):
+                if description is None:
+                    # the same error reading the description from the item would raise
+                    raise NoSuchElementException(f"Could not find the description of {item!r}")
+                if description == value:
+                    yield item
+        else:
+            for item in items:
+                if getattr(item, key, None) == value:
+                    yield item
+
+    def _descriptions(self, items):
+        """Read the descriptions of all the items by a single script.
+
+        Returns ``None`` if the item class does not use the stock :py:attr:`ListItem.description`,
+        such descriptions have to be read from the items one by one.
+        """
+        if getattr(self.item_class, "description", None) is not ListItem.description:
+            return None
+        locators = [item.__locator__() for item in items]
+        if not all(getattr(loc, "by", None) == "xpath" for loc in locators):
+            return None
+        return [
+            None if text is None else normalize_space(text)
+            for text in self.browser.execute_script(
+                self.DESCRIPTIONS_SCRIPT,
+                self,
+                [loc.locator for loc in locators],
+                self.item_class.DESCRIPTION_LOCATOR,
+                silent=True,
+            )
+        ]
 
 
 class FlashMessage(ParametrizedView):
@@ -2852,6 +3645,8 @@ class FlashMessage(ParametrizedView):
 
     # XPath index starting at 1
     index = Parameter("index")
+    # Whether the notification was dismissed through this object
+    _dismissed = False
 
     @property
     def text(self):
@@ -2861,31 +3656,28 @@ class FlashMessage(ParametrizedView):
     def dismiss(self):
         """Close the notification."""
         self.logger.info(f"Dismissed notification with text {self.text!r}.")
-        return self.browser.click(self.DISMISS_LOCATOR, parent=self)
+        result = self.browser.click(self.DISMISS_LOCATOR, parent=self)
+        self._dismissed = True
+        return result
 
     @property
     def icon(self):
-        try:
-            e = self.browser.element(self.ICON_LOCATOR, parent=self)
-        except NoSuchElementException:
-            return None
-
-        for class_ in self.browser.classes(e):
-            if class_.startswith("pficon-"):
-                return class_[7:]
-        else:
-            return None
+        return pficon_name(self.browser, self.ICON_LOCATOR, self)
 
     @property
     def type(self):
-        classes = self.browser.classes(self)
-        for class_ in classes:
-            if class_ in self.TYPE_MAPPING:
-                return self.TYPE_MAPPING[class_]
+        return self.type_from_classes(self.browser.classes(self))
+
+    @classmethod
+    def type_from_classes(cls, classes):
+        """Return the notification type given the classes of the notification element."""
+        matches = cls.TYPE_MAPPING.keys() & set(classes)
+        if matches:
+            return cls.TYPE_MAPPING[next(iter(matches))]
         else:
             raise ValueError(
                 "Could not find a proper notification type."
-                f" Available classes: {self.TYPE_MAPPING!r}."
+                f" Available classes: {cls.TYPE_MAPPING!r}."
                 f" Notification types: {classes!r}."
             )
 
@@ -2895,6 +3687,23 @@ class FlashMessages(View):
 
     ROOT = './/div[@id="flash_msg_div"]'
     MSG_LOCATOR = './div[contains(@class, "flash_text_div")]/div[contains(@class, "alert")]'
+    # [text, classes] of every notification matching the locator given as second argument, the
+    # text is read from the element matching the third one, null if there is none
+    SNAPSHOT_SCRIPT = """\
+        var found = document.evaluate(
+            arguments[1], arguments[0], null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var result = [];
+        for (var i = 0; i < found.snapshotLength; i++) {
+            var msg = found.snapshotItem(i);
+            var text = document.evaluate(
+                arguments[2], msg, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+            result.push([
+                text === null ? null : (text.innerText || text.textContent || ""),
+                Array.from(msg.classList)]);
+        }
+        return result;
+    """
     msg_class = FlashMessage
 
     def __getitem__(self, msg_filter):
@@ -2923,9 +3732,8 @@ class FlashMessages(View):
 
     def messages(self, **msg_filter):
         """Return a generator for all notifications matching the msg_filter.
-        The total number of notifications is re-checked each time, and the parametrized XPath
-        index is re-calculated if necessary, in case any of the previously-yielded
-        notifications have been dismissed.
+        The parametrized XPath index is re-calculated if necessary, in case any of the
+        previously-yielded notifications have been dismissed.
 
         Kwargs:
                text: :py:class:`str` or :py:class:`Pattern` to match against the notification text.
@@ -2939,6 +3747,34 @@ class FlashMessages(View):
               index: The (0-based) index of the notification in the list to return.
                      Default: None.
         """
+        text, types, partial, inverse, index = self._process_filter(msg_filter)
+
+        # Filter via index (starting from 0).
+        # Add 1 for the XPath index.
+        if isinstance(index, int):
+            start = index + 1
+            stop = start + 1
+        else:
+            start = 1
+            stop = self.msg_count + 1
+
+        dismissed = 0
+        for i in range(start, stop):
+            if isinstance(index, int):
+                j = i
+            else:
+                # Notifications dismissed meanwhile are gone, the following ones moved up
+                j = i - dismissed
+
+            msg = self.msg_class(self, index=j)
+
+            if self._matches(lambda: msg.type, lambda: msg.text, text, types, partial, inverse):
+                yield msg
+                if msg._dismissed:
+                    dismissed += 1
+
+    def _process_filter(self, msg_filter):
+        """Unpack and log the filter, see :py:meth:`messages` for the keys."""
         text = msg_filter.get("text", None)
         t = msg_filter.get("t", None)
         partial = msg_filter.get("partial", False)
@@ -2946,7 +3782,6 @@ class FlashMessages(View):
         index = msg_filter.get("index", None)
 
         types = t if isinstance(t, (tuple, list, set, type(None))) else (t,)
-        op = not_ if inverse else bool
 
         # Log message describing the type of notification lookup.
         if any((text, types, partial, inverse)):
@@ -2963,40 +3798,71 @@ class FlashMessages(View):
             log_msg = "Reading all notifications."
 
         self.logger.info(log_msg)
+        return text, types, partial, inverse, index
 
-        # Filter via index (starting from 0).
-        # Add 1 for the XPath index.
-        if isinstance(index, int):
-            start = index + 1
-            stop = start + 1
-        else:
-            start = 1
-            stop = self.msg_count + 1
+    @staticmethod
+    def _matches(msg_type, msg_text, text, types, partial, inverse):
+        """Whether a notification matches the filter.
 
-        for i in range(start, stop):
-            if isinstance(index, int):
-                j = i
-            else:
-                new_stop = self.msg_count + 1
-                j = i - (stop - new_stop)
+        The type and the text of the notification are passed as callables, so they are only
+        read when the filter needs them.
+        """
+        op = not_ if inverse else bool
+        if types and not op(msg_type() in types):
+            return False
+        if isinstance(text, Pattern) and not op(text.match(msg_text())):
+            return False
+        if isinstance(text, str) and not op(
+            (partial and text in msg_text()) or (not partial and text == msg_text())
+        ):
+            return False
+        return True
 
-            msg = self.msg_class(self, index=j)
+    @retry_element
+    def read(self, **msg_filter):
+        """Return a list containing the notifications' text.
 
-            if types and not op(msg.type in types):
-                continue
-            if isinstance(text, Pattern) and not op(text.match(msg.text)):
-                continue
-            if isinstance(text, str) and not op(
-                (partial and text in msg.text) or (not partial and text == msg.text)
-            ):
-                continue
+        All the notifications are read by a single script, the filter is then applied to them.
+        """
+        return self._read_snapshot(self._snapshot(), **msg_filter)
 
-            yield msg
+    @property
+    def _msg_view_class(self):
+        """The class of the notifications, ``msg_class`` is accessed as a view request."""
+        return self.msg_class.view_class
 
-    @retry_element
-    def read(self, **msg_filter):
-        """Return a list containing the notifications' text."""
-        return [msg.text for msg in self.messages(**msg_filter)]
+    def _snapshot(self):
+        """``[text, classes]`` of all the notifications, read by a single script."""
+        return self.browser.execute_script(
+            self.SNAPSHOT_SCRIPT,
+            self,
+            self.MSG_LOCATOR,
+            self._msg_view_class.TEXT_LOCATOR,
+            silent=True,
+        )
+
+    def _read_snapshot(self, snapshot, **msg_filter):
+        """Texts of the notifications in the snapshot matching the filter, see :py:meth:`read`."""
+        text, types, partial, inverse, index = self._process_filter(msg_filter)
+        if isinstance(index, int):
+            if not 0 <= index < len(snapshot):
+                raise NoSuchElementException(f"No notification with index {index}")
+            snapshot = [snapshot[index]]
+        result = []
+        for msg_text, classes in snapshot:
+            if msg_text is None:
+                raise NoSuchElementException("Could not find the text of the notification")
+            msg_text = normalize_space(msg_text)
+            if self._matches(
+                lambda: self._msg_view_class.type_from_classes(set(classes)),
+                lambda: msg_text,
+                text,
+                types,
+                partial,
+                inverse,
+            ):
+                result.append(msg_text)
+        return result
 
     @retry_element
     def dismiss(self):
@@ -3010,28 +3876,35 @@ class FlashMessages(View):
         Kwargs:
                ignore_messages: :py:class:`list` of notification text to ignore. Default: None
         """
+        self._assert_no_error(self._snapshot(), ignore_messages)
+
+    def _assert_no_error(self, snapshot, ignore_messages=None):
         if ignore_messages is None:
             ignore_messages = []
         msg_filter = {"t": {"success", "info", "warning"}, "inverse": True}
 
         self.logger.info("Asserting there are no error notifications.")
-        errs = self.read(**msg_filter)
+        errs = self._read_snapshot(snapshot, **msg_filter)
         if set(errs) - set(ignore_messages):
             self.logger.error(errs)
             raise AssertionError(f"assert_no_error: found error notifications {errs}")
 
     def assert_message(self, text, t=None, partial=False):
+        self._assert_message(self._snapshot(), text, t=t, partial=partial)
+
+    def _assert_message(self, snapshot, text, t=None, partial=False):
         msg_filter = {"text": text, "t": t, "partial": partial}
-        all_msgs = self.read()
-        if not self.read(**msg_filter):
+        if not self._read_snapshot(snapshot, **msg_filter):
             raise AssertionError(
                 "assert_message: failed to find matching notifications."
-                f" Available notifications: {all_msgs}"
+                f" Available notifications: {self._read_snapshot(snapshot)}"
             )
 
     def assert_success_message(self, text, t=None, partial=False):
-        self.assert_no_error()
-        self.assert_message(text, t=(t or "success"), partial=partial)
+        # Both checks are done on the same single read of the notifications
+        snapshot = self._snapshot()
+        self._assert_no_error(snapshot)
+        self._assert_message(snapshot, text, t=(t or "success"), partial=partial)
 
     @property
     def is_displayed(self):
@@ -28,7 +28,8 @@ class IconConstants(Enum):
 
     @classmethod
     def icon_enums(cls):
-        return {a: s for a, s in vars(IconConstants).items() if isinstance(s, Enum)}
+        # the members mapping is built by Enum already, no need to scan all the class attributes
+        return dict(cls.__members__)
 
 
 class PFIcon:
@@ -39,6 +40,22 @@ class PFIcon:
     """
 
     icons = IconConstants
+    # same matching as contains(@class, ...) in XPath, but done by the native selector engine
+    ICON_SELECTOR = '[class*="pficon"], [class*="fa"]'
+    # classes of the only element under the first argument matching the selector given as second
+    # one, null when there is none or more of them
+    ICON_CLASSES_SCRIPT = """\
+        var found = arguments[0].querySelectorAll(arguments[1]);
+        return found.length === 1 ? Array.from(found[0].classList) : null;
+    """
+    # the same as ICON_CLASSES_SCRIPT, for each of the elements in the first argument
+    ICONS_CLASSES_SCRIPT = """\
+        var selector = arguments[1];
+        return arguments[0].map(function (el) {
+            var found = el.querySelectorAll(selector);
+            return found.length === 1 ? Array.from(found[0].classList) : null;
+        });
+    """
 
     @classmethod
     def icon_from_element(cls, element, browser):
@@ -51,20 +68,44 @@ class PFIcon:
         Raises:
             widgetastic.exceptions.NoSuchElementException when no icon span found
         """
-        els = browser.elements(
-            './/*[contains(@class, "pficon") or contains(@class, "fa")]', parent=element
+        # the icon element is found and its classes are read by a single script
+        classes = browser.execute_script(
+            cls.ICON_CLASSES_SCRIPT, element, cls.ICON_SELECTOR, silent=True
         )
-        if len(els) != 1:
-            return None  # multiple icons
+        return cls._icon_from_classes(classes)
 
-        icon_class = [
-            c for c in browser.classes(els.pop()) if c.startswith("pficon-") or c.startswith("fa-")
-        ]
-        # slice off first 6 chars if a class was found
-        icon_name = icon_class.pop() if icon_class else None
-        icons = [
-            getattr(cls.icons, attr, None)
-            for attr, icon_string in cls.icons.icon_enums().items()
-            if icon_string.value == icon_name
+    @classmethod
+    def icons_from_elements(cls, elements, browser):
+        """The same as :py:meth:`icon_from_element` for all the elements, in a single script call
+
+        Args:
+            elements: webelement objects that will be searched for pficon classes
+            browser: browser instance to run the script
+
+        Returns:
+            list of the icons in the order of the elements, None for those without a single icon
+        """
+        elements = list(elements)
+        if not elements:
+            return []
+        return [
+            cls._icon_from_classes(classes)
+            for classes in browser.execute_script(
+                cls.ICONS_CLASSES_SCRIPT, elements, cls.ICON_SELECTOR, silent=True
+            )
         ]
-        return icons.pop() if icons else None
+
+    @classmethod
+    def _icon_from_classes(cls, classes):
+        """Icon constant for the classes of the icon element, None if there is no such element"""
+        if classes is None:
+            return None  # no or multiple icons
+
+        # with more than one icon class, the last one in the class attribute is used; the classes
+        # used to be read as a set, which picked one of them arbitrarily
+        icon_name = next((c for c in reversed(classes) if c.startswith(("pficon-", "fa-"))), None)
+        try:
+            # Enum lookup by value, no need to scan all the constants
+            return cls.icons(icon_name)
+        except ValueError:
+            return None
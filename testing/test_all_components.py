@@ -4,8 +4,6 @@ them in a programatically defined view class as a new type, which is then
 instantiated. The widgets appear to get instantiated upon accessing them in the instantiated view.
 After all of this, the behavior of the widget objects can be tested.
 """
-import inspect
-
 import pytest
 from widgetastic.utils import attributize_string
 from widgetastic.widget import View
@@ -16,13 +14,19 @@ import widgetastic_patternfly as wp
 
 collected_widgets = {
     name: t
-    for name, t in inspect.getmembers(wp)
-    if (inspect.isclass(t) and issubclass(t, Widget) and not issubclass(t, wp.ParametrizedView))
+    for name, t in sorted(vars(wp).items())
+    if (isinstance(t, type) and issubclass(t, Widget) and not issubclass(t, wp.ParametrizedView))
 }
 """ Subclasses of Widget from the widgetastic_patternfly module (including
 it's own imports), that are gonna be tested. Not including the
 ParametrizedView. """
 
+widget_names = tuple(collected_widgets)
+""" Names of the `collected_widgets` for the parametrized tests, already sorted. """
+
+widget_attributes = {name: attributize_string(name) for name in widget_names}
+""" Names of the view attributes holding the `collected_widgets`. """
+
 
 DUMMY_NAME = "name_of_the_dummy"
 DUMMY_ID = "id_of_the_dummy"
@@ -66,7 +70,7 @@ def test_view_class():
 
     # Instantiate objects to be set in the view with required params for __init__.
     attributes = {
-        f"{attributize_string(name)}": cls(**init_values.get(cls, {}))
+        widget_attributes[name]: cls(**init_values.get(cls, {}))
         for name, cls in collected_widgets.items()
     }
 
@@ -77,13 +81,14 @@ def test_view_class():
     return view_class
 
 
-@pytest.fixture
-def test_view(browser, test_view_class):
-    view = test_view_class(browser)
+@pytest.fixture(scope="module")
+def test_view(custom_browser, test_view_class):
+    """The tests only access the widgets, so one view on the session browser serves them all."""
+    view = test_view_class(custom_browser)
     return view
 
 
-@pytest.mark.parametrize("widget_name", collected_widgets.keys())
+@pytest.mark.parametrize("widget_name", widget_names)
 def test_widget_init(test_view, widget_name):
     """Test basic instantiation of the widgets in a view.
 
@@ -99,13 +104,13 @@ def test_widget_init(test_view, widget_name):
     We got the view as the test_view fixture, so we now need to access it to
     check it won't produce an exception."""
 
-    assert getattr(test_view, attributize_string(widget_name))
+    assert getattr(test_view, widget_attributes[widget_name])
 
 
-@pytest.mark.parametrize("widget_name", collected_widgets.keys())
+@pytest.mark.parametrize("widget_name", widget_names)
 def test_widget_stringification(test_view, widget_name):
     """Tests whether the widget can be stringified.
     All the widgets that can be instantiated should be able to stringify."""
-    wgt = getattr(test_view, attributize_string(widget_name))
+    wgt = getattr(test_view, widget_attributes[widget_name])
     assert isinstance(str(wgt), str)
     assert isinstance(repr(wgt), str)
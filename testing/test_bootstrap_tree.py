@@ -1,6 +1,29 @@
+import re
+
+import pytest
 from widgetastic.widget import View
 
 from widgetastic_patternfly import BootstrapTreeview
+from widgetastic_patternfly import CandidateNotFound
+from widgetastic_patternfly import CheckableBootstrapTreeview
+
+HOST_PATH = ("Datacenter", "Cluster 1", "Host 2")
+CONTENTS = ["Datacenter", [["Cluster 1", ["Host 1", "Host 2"]], ["Cluster 2", ["Host 3"]]]]
+CONTENTS_WITH_IMAGES = [
+    ("pficon-network", "Datacenter"),
+    [
+        [
+            ("fa-folder", "Cluster 1"),
+            [("pficon-screen", "Host 1"), ("pficon-screen", "Host 2")],
+        ],
+        [("fa-folder", "Cluster 2"), [("pficon-screen", "Host 3")]],
+    ],
+]
+
+
+class TreeView(View):
+    tree = BootstrapTreeview(tree_id="treeview2")
+    checkable_tree = CheckableBootstrapTreeview(tree_id="treeview2")
 
 
 def test_bootstrap_tree(browser):
@@ -15,5 +38,73 @@ def test_bootstrap_tree(browser):
     assert view.tree.root_item_count > 1
     # assert that we have multiple root items
     assert len(view.tree.root_items) > 1
-    # TODO: add more to the widget in testing page so that we can test more complex
-    #       functionality, such as currently_selected
+
+
+def test_bootstrap_tree_currently_selected(browser):
+    view = TreeView(browser)
+
+    assert view.tree.currently_selected is None
+    view.tree.click_path(*HOST_PATH)
+    assert view.tree.currently_selected == list(HOST_PATH)
+    assert view.tree.read() == list(HOST_PATH)
+
+    assert not view.tree.fill(list(HOST_PATH))
+    assert view.tree.fill(["Datacenter", "Cluster 2", "Host 3"])
+    assert view.tree.currently_selected == ["Datacenter", "Cluster 2", "Host 3"]
+
+
+def test_bootstrap_tree_expand_path(browser):
+    view = TreeView(browser)
+
+    # plain text steps
+    assert browser.text(view.tree.expand_path(*HOST_PATH)) == "Host 2"
+    # regex steps
+    leaf = view.tree.expand_path("Datacenter", re.compile(r"Cluster 2$"), re.compile(r"Host"))
+    assert browser.text(leaf) == "Host 3"
+    # steps matching the image too
+    leaf = view.tree.expand_path(
+        "Datacenter", ("fa-folder", "Cluster 1"), ("pficon-screen", "Host 1")
+    )
+    assert browser.text(leaf) == "Host 1"
+
+    assert view.tree.has_path(*HOST_PATH)
+    assert not view.tree.has_path("Datacenter", "Cluster 2", "Host 1")
+    assert not view.tree.has_path("Datacenter", ("pficon-screen", "Cluster 1"))
+    with pytest.raises(CandidateNotFound):
+        view.tree.expand_path("Datacenter", re.compile(r"Cluster 3"))
+
+
+def test_bootstrap_tree_read_contents(browser):
+    view = TreeView(browser)
+
+    # the tree is collapsed, so it is walked expanding the nodes
+    assert view.tree.read_contents() == CONTENTS
+    # now fully expanded, the tree is read in one go
+    assert view.tree.read_contents() == CONTENTS
+    assert view.tree.read_contents(include_images=True) == CONTENTS_WITH_IMAGES
+
+    assert view.tree.read_contents(include_images=True, collapse_after_read=True) == (
+        CONTENTS_WITH_IMAGES
+    )
+    assert view.tree.is_collapsed(view.tree.root_item)
+    assert view.tree.read_contents(include_images=True) == CONTENTS_WITH_IMAGES
+
+
+def test_checkable_bootstrap_tree(browser):
+    view = TreeView(browser)
+
+    assert not view.checkable_tree.node_checked(*HOST_PATH)
+    assert view.checkable_tree.check_node(*HOST_PATH)
+    assert view.checkable_tree.node_checked(*HOST_PATH)
+    # already checked
+    assert not view.checkable_tree.check_node(*HOST_PATH)
+
+    assert view.checkable_tree.uncheck_node(*HOST_PATH)
+    assert not view.checkable_tree.node_checked(*HOST_PATH)
+    assert not view.checkable_tree.uncheck_node(*HOST_PATH)
+
+    assert view.checkable_tree.fill(view.checkable_tree.CheckNode(HOST_PATH))
+    assert view.checkable_tree.node_checked(*HOST_PATH)
+    assert not view.checkable_tree.fill(view.checkable_tree.CheckNode(HOST_PATH))
+    assert view.checkable_tree.fill(view.checkable_tree.UncheckNode(HOST_PATH))
+    assert not view.checkable_tree.node_checked(*HOST_PATH)
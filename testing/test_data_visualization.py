@@ -85,6 +85,9 @@ def test_single_legend_charts(browser, graph):
 
     # read overall chart
     assert chart.read() == data
+    # unchanged chart is served from the last read, forced read goes to the chart again
+    assert chart.read() == data
+    assert chart.read(force=True) == data
 
     # check  for x axis values
     for x_point, value in data.items():
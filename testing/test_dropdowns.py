@@ -32,3 +32,9 @@ def test_kebab(browser):
         # closes by default after selection
         assert not view.kebab_menu.is_opened
         assert item == view.kebab_output.read()
+
+    # check selection by JavaScript, the kebab stays closed
+    for item in reversed(view.kebab_menu.items):
+        view.kebab_menu.js_select(item)
+        assert not view.kebab_menu.is_opened
+        assert item == view.kebab_output.read()
@@ -16,6 +16,9 @@ OK_MSGS = [
 ]
 ERROR_MSGS = [Message("Not Configured", "error")]
 MSGS = OK_MSGS + ERROR_MSGS
+OK_TEXTS = [msg.text for msg in OK_MSGS]
+ERROR_TEXTS = [msg.text for msg in ERROR_MSGS]
+RETIREMENT_RE = re.compile("^Retirement")
 
 
 def test_flashmessage(browser):
@@ -29,7 +32,7 @@ def test_flashmessage(browser):
         assert msg == MSG.text
 
     # Verify assert_no_error() with ignore_messages, then dismiss the error messages
-    view.flash.assert_no_error(ignore_messages=[msg.text for msg in ERROR_MSGS])
+    view.flash.assert_no_error(ignore_messages=ERROR_TEXTS)
     for msg in view.flash.messages():
         if msg.type == "error":
             msg.dismiss()
@@ -38,9 +41,8 @@ def test_flashmessage(browser):
     view.flash.assert_no_error()
 
     # Test regex match.
-    t = re.compile("^Retirement")
-    view.flash.assert_message(t)
-    view.flash.assert_success_message(t)
+    view.flash.assert_message(RETIREMENT_RE)
+    view.flash.assert_success_message(RETIREMENT_RE)
 
     # Test partial pattern match.
     t = "etirement"
@@ -49,7 +51,7 @@ def test_flashmessage(browser):
 
     # Test inverse pattern match.
     t = "This message does not exist"
-    assert view.flash.read(text=t, inverse=True) == [msg.text for msg in OK_MSGS]
+    assert view.flash.read(text=t, inverse=True) == OK_TEXTS
 
     view.flash.dismiss()
     assert not view.flash.read()
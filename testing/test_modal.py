@@ -1,6 +1,5 @@
 from time import sleep
 
-import pytest
 from wait_for import wait_for
 from widgetastic.widget import TextInput
 from widgetastic.widget import View
@@ -20,6 +19,11 @@ def workaround_modal_close_n_open_timing_issue():
     sleep(0.1)
 
 
+def wait_modal_displayed(modal, displayed=True):
+    """Poll the modal until it is shown or hidden, the first check happens right away"""
+    wait_for(lambda: modal.is_displayed == displayed, delay=0.1, num_sec=MODAL_INTERACTION_TIMEOUT)
+
+
 class SpecificModal(Modal):
     """Specific Modal class overwrites the body of Modal, since the form will vary."""
 
@@ -30,7 +34,6 @@ class SpecificModal(Modal):
         field_three = TextInput(id="textInput3-modal-markup")
 
 
-@pytest.mark.skip(reason="https://github.com/RedHatQE/widgetastic.patternfly/issues/126")
 def test_generic_modal(browser):
     """
     Test the modal, including all methods/properties
@@ -51,34 +54,33 @@ def test_generic_modal(browser):
     # Open the modal
     assert not view.button.disabled
     view.button.click()
-    wait_for(lambda: view.modal.is_displayed, delay=0.5, num_sec=MODAL_INTERACTION_TIMEOUT)
+    wait_modal_displayed(view.modal)
 
     assert view.modal.title == title
 
     # close the modal via the "x"
     view.modal.close()
-    view.flush_widget_cache()
-    wait_for(lambda: not view.modal.is_displayed, delay=0.5, num_sec=MODAL_INTERACTION_TIMEOUT)
+    wait_modal_displayed(view.modal, displayed=False)
 
     workaround_modal_close_n_open_timing_issue()
 
     # open modal again
     view.button.click()
-    wait_for(lambda: view.modal.is_displayed, delay=0.5, num_sec=MODAL_INTERACTION_TIMEOUT)
+    wait_modal_displayed(view.modal)
     # make sure buttons are not disabled
     assert not view.modal.footer.dismiss.disabled
     assert not view.modal.footer.accept.disabled
     # make sure the cancel button works
     view.modal.dismiss()
-    wait_for(lambda: not view.modal.is_displayed, delay=0.1, num_sec=MODAL_INTERACTION_TIMEOUT)
+    wait_modal_displayed(view.modal, displayed=False)
 
     workaround_modal_close_n_open_timing_issue()
     # open modal to fill the form
     view.button.click()
-    wait_for(lambda: view.modal.is_displayed, delay=0.5, num_sec=5)
+    wait_modal_displayed(view.modal)
     assert view.fill(
         {"modal": {"body": {"field_one": "value1", "field_two": "value2", "field_three": "value3"}}}
     )
     # make sure accept button works
     view.modal.accept()
-    wait_for(lambda: not view.modal.is_displayed, delay=0.1, num_sec=MODAL_INTERACTION_TIMEOUT)
+    wait_modal_displayed(view.modal, displayed=False)